@@ -6,11 +6,14 @@ import math
 import time
 import string
 import secrets
+import functools
 import argparse
 import platform
 import subprocess
 import threading
 import shutil
+import concurrent.futures
+from dataclasses import dataclass
 
 try:
     import pyperclip
@@ -18,6 +21,21 @@ try:
 except ImportError:
     HAS_PYPERCLIP = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
+BATCH_THRESHOLD = 64
+PARALLEL_THRESHOLD = 4096
+
 MIN_LENGTH = 8
 MAX_LENGTH = 128
 DEFAULT_LENGTH = 20
@@ -39,6 +57,12 @@ COLOR_RED = '\033[91m'
 COLOR_YELLOW = '\033[93m'
 COLOR_RESET = '\033[0m'
 
+ENTROPY_TIERS = (
+    f"{COLOR_RED}⚠️ WEAK{COLOR_RESET}",
+    f"{COLOR_YELLOW}✅ OK{COLOR_RESET}",
+    f"{COLOR_GREEN}🔒 STRONG{COLOR_RESET}",
+)
+
 NATO_ALPHABET = {
     'A': 'Alpha', 'B': 'Bravo', 'C': 'Charlie', 'D': 'Delta', 'E': 'Echo',
     'F': 'Foxtrot', 'G': 'Golf', 'H': 'Hotel', 'I': 'India', 'J': 'Juliet',
@@ -49,11 +73,20 @@ NATO_ALPHABET = {
     '4': 'Four', '5': 'Five', '6': 'Six', '7': 'Seven', '8': 'Eight', '9': 'Nine'
 }
 
+@dataclass(frozen=True)
+class PresetSpec:
+    len: int
+    u: bool
+    l: bool
+    d: bool
+    s: bool
+    safe: bool
+
 PRESETS = {
-    'web':      {'len': 16, 'u': True, 'l': True, 'd': True, 's': True, 'safe': True},
-    'strong':   {'len': 32, 'u': True, 'l': True, 'd': True, 's': True, 'safe': False},
-    'pin':      {'len': 8,  'u': False,'l': False,'d': True, 's': False,'safe': True},
-    'wifi':     {'len': 24, 'u': False,'l': True, 'd': True, 's': False,'safe': True},
+    'web':      PresetSpec(16, True,  True,  True,  True,  True),
+    'strong':   PresetSpec(32, True,  True,  True,  True,  False),
+    'pin':      PresetSpec(8,  False, False, True,  False, True),
+    'wifi':     PresetSpec(24, False, True,  True,  False, True),
 }
 
 DEFAULT_CONFIG = {
@@ -342,23 +375,84 @@ def input_int(prompt, min_val, max_val, default):
         except ValueError:
             print(P['err_int'])
 
+_VALID_Y = frozenset({'y', 'yes', 'д', 'да', '1'})
+_VALID_N = frozenset({'n', 'no', 'н', 'нет', '0'})
+
 def input_bool(prompt, default=True):
     hint = "[Y/n]" if default else "[y/N]"
-    valid_y = {'y', 'yes', 'д', 'да', '1'}
-    valid_n = {'n', 'no', 'н', 'нет', '0'}
     while True:
         raw = input(f"{prompt} {hint}: ").strip().lower()
         if not raw:
             return default
-        if raw in valid_y:
+        if raw in _VALID_Y:
             return True
-        if raw in valid_n:
+        if raw in _VALID_N:
             return False
         print(P['err_yn'])
 
+@functools.lru_cache(maxsize=32)
+def _translate_table(full_pool):
+    """256-byte table mapping any byte to a pool character (byte % pool size)."""
+    encoded = full_pool.encode('ascii')
+    return bytes(encoded[i % len(encoded)] for i in range(256))
+
+def draw_indices(pool_size, count):
+    """Return `count` uniform indices in [0, pool_size) from batched os.urandom.
+
+    One urandom block replaces per-index secrets.choice calls; out-of-range
+    bytes are rejected and the block is refilled when exhausted.
+    """
+    if pool_size > 256:
+        return [secrets.randbelow(pool_size) for _ in range(count)]
+    mask = (1 << (pool_size - 1).bit_length()) - 1
+    if pool_size & (pool_size - 1) == 0:
+        # Power-of-two pool: every masked byte is a valid uniform index.
+        return [b & mask for b in os.urandom(count)]
+    indices =[]
+    while len(indices) < count:
+        raw = os.urandom((count - len(indices)) * 2)
+        for b in raw:
+            v = b & mask
+            if v < pool_size:
+                indices.append(v)
+                if len(indices) == count:
+                    break
+    return indices
+
+def _secure_shuffle(buf):
+    """In-place Fisher-Yates shuffle fed by a pre-drawn os.urandom block.
+
+    Each swap index comes from a 16-bit value reduced mod (i+1), rejecting
+    values above the largest multiple of the range to stay uniform. One
+    urandom block replaces the syscall-per-swap of SystemRandom().shuffle.
+    """
+    n = len(buf)
+    if n < 2:
+        return
+    raw = os.urandom(n * 4)
+    pos = 0
+    for i in range(n - 1, 0, -1):
+        bound = i + 1
+        limit = 65536 - (65536 % bound)
+        while True:
+            if pos + 2 > len(raw):
+                raw = os.urandom(n * 4)
+                pos = 0
+            v = (raw[pos] << 8) | raw[pos + 1]
+            pos += 2
+            if v < limit:
+                break
+        j = v % bound
+        buf[i], buf[j] = buf[j], buf[i]
+
+_LOG2_CACHE = {}
+
 def calculate_entropy(pool_size, length):
     if pool_size <= 0 or length <= 0: return 0
-    return length * math.log2(pool_size)
+    bits_per_char = _LOG2_CACHE.get(pool_size)
+    if bits_per_char is None:
+        bits_per_char = _LOG2_CACHE[pool_size] = math.log2(pool_size)
+    return length * bits_per_char
 
 def filter_pool(pool, exclude, no_ambiguous):
     res = pool
@@ -368,7 +462,30 @@ def filter_pool(pool, exclude, no_ambiguous):
         res = "".join(c for c in res if c not in AMBIGUOUS_CHARS)
     return res
 
-def generate_password_standard(length, use_upper, use_lower, use_digits, use_symbols, use_safe, custom_chars, exclude, no_ambiguous):
+def _build_pool_cache():
+    """All 32 (lower|upper|digits|symbols|safe) pool combinations, built once."""
+    cache = {}
+    for mask in range(32):
+        pools =[]
+        if mask & 1: pools.append(CHARS_LOWER)
+        if mask & 2: pools.append(CHARS_UPPER)
+        if mask & 4: pools.append(CHARS_DIGITS)
+        if mask & 8: pools.append(CHARS_SYMBOLS_SAFE if mask & 16 else CHARS_SYMBOLS)
+        cache[mask] = (tuple(pools), "".join(pools))
+    return cache
+
+_POOL_CACHE = _build_pool_cache()
+
+def build_pool_spec(use_upper, use_lower, use_digits, use_symbols, use_safe, custom_chars, exclude, no_ambiguous):
+    """Assemble and validate the character pools once; returns (pools, full_pool)."""
+    if not custom_chars and not exclude and not no_ambiguous:
+        mask = ((1 if use_lower else 0) | (2 if use_upper else 0) |
+                (4 if use_digits else 0) | (8 if use_symbols else 0) |
+                (16 if use_safe else 0))
+        pools, full_pool = _POOL_CACHE[mask]
+        if not full_pool:
+            raise ValueError(P['err_pool_empty'])
+        return pools, full_pool
     pools =[]
     full_pool = ""
     if custom_chars:
@@ -393,19 +510,129 @@ def generate_password_standard(length, use_upper, use_lower, use_digits, use_sym
             if f: pools.append(f); full_pool += f
     if not full_pool:
         raise ValueError(P['err_pool_empty'])
+    return tuple(pools), full_pool
+
+def generate_from_spec(spec, length):
+    pools, full_pool = spec
     if length < MIN_LENGTH:
         raise ValueError(P['err_min_len'].format(MIN_LENGTH=MIN_LENGTH))
     if length < len(pools):
         raise ValueError(P['err_cat_len'].format(length=length, cats=len(pools)))
 
+    n = len(full_pool)
+    if full_pool.isascii():
+        # ASCII pools fill a bytearray directly: one byte per character
+        # instead of a PyUnicode object per character.
+        buf = bytearray(length)
+        pos = 0
+        for pool in pools:
+            buf[pos] = pool.encode('ascii')[draw_indices(len(pool), 1)[0]]
+            pos += 1
+        remaining = length - pos
+        if remaining and n <= 256 and (n & (n - 1)) == 0:
+            # Pool size divides 256: byte % n is uniform, so one token_bytes
+            # call plus a C-level translate replaces the whole rejection loop.
+            buf[pos:] = secrets.token_bytes(remaining).translate(_translate_table(full_pool))
+        elif remaining:
+            full_bytes = full_pool.encode('ascii')
+            for off, idx in enumerate(draw_indices(n, remaining)):
+                buf[pos + off] = full_bytes[idx]
+        _secure_shuffle(buf)
+        return buf.decode('ascii'), calculate_entropy(n, length)
+
     password_chars =[]
     for pool in pools:
-        password_chars.append(secrets.choice(pool))
-    for _ in range(length - len(password_chars)):
-        password_chars.append(secrets.choice(full_pool))
-    secrets.SystemRandom().shuffle(password_chars)
+        password_chars.append(pool[draw_indices(len(pool), 1)[0]])
+    rest = draw_indices(n, length - len(password_chars))
+    password_chars.extend(full_pool[i] for i in rest)
+    _secure_shuffle(password_chars)
+
+    return ''.join(password_chars), calculate_entropy(n, length)
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _fill_indices(buf, pool_size, mask, out):
+        """Reject-and-accept kernel: compiled once, then runs as machine code."""
+        j = 0
+        for i in range(buf.shape[0]):
+            v = buf[i] & mask
+            if v < pool_size:
+                out[j] = v
+                j += 1
+                if j == out.shape[0]:
+                    break
+        return j
+
+def _np_draw_indices(pool_size, count):
+    """NumPy variant of draw_indices: masked rejection over whole arrays."""
+    if pool_size > 256:
+        # Single bytes cannot index a wider pool; use the scalar fallback.
+        return np.array(draw_indices(pool_size, count))
+    mask = (1 << (pool_size - 1).bit_length()) - 1
+    if pool_size & (pool_size - 1) == 0:
+        return np.frombuffer(os.urandom(count), dtype=np.uint8) & mask
+    out = np.empty(count, dtype=np.uint8)
+    filled = 0
+    while filled < count:
+        raw = np.frombuffer(os.urandom((count - filled) * 2), dtype=np.uint8)
+        if HAS_NUMBA:
+            filled += _fill_indices(raw, pool_size, mask, out[filled:])
+        else:
+            accepted = raw[(raw & mask) < pool_size] & mask
+            take = min(len(accepted), count - filled)
+            out[filled:filled + take] = accepted[:take]
+            filled += take
+    return out
+
+def generate_batch_from_spec(spec, length, count):
+    """Generate `count` passwords at once with vectorized index draws.
+
+    Same guarantees as generate_from_spec (one char per category, secure
+    shuffle via argsort over random 64-bit keys), but the per-character work
+    happens in C over (count, length) arrays instead of Python loops.
+    """
+    pools, full_pool = spec
+    if length < MIN_LENGTH:
+        raise ValueError(P['err_min_len'].format(MIN_LENGTH=MIN_LENGTH))
+    if length < len(pools):
+        raise ValueError(P['err_cat_len'].format(length=length, cats=len(pools)))
 
-    return ''.join(password_chars), calculate_entropy(len(full_pool), length)
+    pool_arr = np.frombuffer(full_pool.encode('ascii'), dtype=np.uint8)
+    chars = np.empty((count, length), dtype=np.uint8)
+    for col, pool in enumerate(pools):
+        p_arr = np.frombuffer(pool.encode('ascii'), dtype=np.uint8)
+        chars[:, col] = p_arr[_np_draw_indices(len(pool), count)]
+    remaining = length - len(pools)
+    if remaining:
+        idx = _np_draw_indices(len(full_pool), count * remaining).reshape(count, remaining)
+        chars[:, len(pools):] = pool_arr[idx]
+    keys = np.frombuffer(os.urandom(count * length * 8), dtype=np.uint64).reshape(count, length)
+    chars = np.take_along_axis(chars, np.argsort(keys, axis=1), axis=1)
+    bits = calculate_entropy(len(full_pool), length)
+    return [(row.tobytes().decode('ascii'), bits) for row in chars]
+
+def _gen_worker(args):
+    """Worker for parallel bulk generation; each call draws fresh urandom."""
+    spec, length, count = args
+    if HAS_NUMPY and spec[1].isascii():
+        return generate_batch_from_spec(spec, length, count)
+    return [generate_from_spec(spec, length) for _ in range(count)]
+
+def generate_parallel_from_spec(spec, length, count):
+    """Split a large batch across CPU cores with a process pool."""
+    workers = min(os.cpu_count() or 1, 8)
+    base, extra = divmod(count, workers)
+    chunks = [(spec, length, base + (1 if i < extra else 0)) for i in range(workers)]
+    chunks = [c for c in chunks if c[2]]
+    results =[]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunks)) as ex:
+        for rows in ex.map(_gen_worker, chunks):
+            results.extend(rows)
+    return results
+
+def generate_password_standard(length, use_upper, use_lower, use_digits, use_symbols, use_safe, custom_chars, exclude, no_ambiguous):
+    spec = build_pool_spec(use_upper, use_lower, use_digits, use_symbols, use_safe, custom_chars, exclude, no_ambiguous)
+    return generate_from_spec(spec, length)
 
 def generate_passphrase(word_count, sep, wordlist_path):
     if word_count < 2:
@@ -433,34 +660,62 @@ def generate_mask(mask, use_safe, exclude, no_ambiguous):
         bits += math.log2(len(pool))
     return "".join(res), bits
 
+def _format_grouped(pwd_bytes, group_size, sep_bytes):
+    """Write groups and separators at computed offsets into one buffer."""
+    n = len(pwd_bytes)
+    num_groups = (n + group_size - 1) // group_size
+    out = bytearray(n + (num_groups - 1) * len(sep_bytes))
+    sep_len = len(sep_bytes)
+    pos = 0
+    for src in range(0, n, group_size):
+        end = min(src + group_size, n)
+        out[pos:pos + (end - src)] = pwd_bytes[src:end]
+        pos += end - src
+        if end < n:
+            out[pos:pos + sep_len] = sep_bytes
+            pos += sep_len
+    return out
+
 def format_output(password, group_size, separator):
     if group_size and group_size > 0:
+        if password.isascii():
+            return _format_grouped(password.encode('ascii'), group_size,
+                                   separator.encode('utf-8')).decode('utf-8')
         parts = [password[i:i+group_size] for i in range(0, len(password), group_size)]
         return separator.join(parts)
     return password
 
+def _detect_clipboard_cmd():
+    """Pick the clipboard command once; returns (argv, error_key)."""
+    system = platform.system()
+    if system == 'Darwin':
+        return ["pbcopy"], None
+    if system == 'Windows':
+        return ["clip"], None
+    if system == 'Linux':
+        if shutil.which("xclip"):
+            return ["xclip", "-selection", "clipboard"], None
+        if shutil.which("xsel"):
+            return ["xsel", "--clipboard", "--input"], None
+        return None, 'err_xclip'
+    return None, 'err_os_unsupported'
+
+_CLIPBOARD_CMD, _CLIPBOARD_ERR = _detect_clipboard_cmd()
+
+_pyperclip_broken = False
+
 def copy_to_clipboard(text):
-    if HAS_PYPERCLIP:
+    global _pyperclip_broken
+    if HAS_PYPERCLIP and not _pyperclip_broken:
         try:
             pyperclip.copy(text)
             return True, "OK (pyperclip)"
         except Exception:
-            pass
-    system = platform.system()
+            _pyperclip_broken = True
+    if _CLIPBOARD_CMD is None:
+        return False, P[_CLIPBOARD_ERR]
     try:
-        if system == 'Darwin':
-            subprocess.run("pbcopy", universal_newlines=True, input=text, check=True)
-        elif system == 'Windows':
-            subprocess.run("clip", universal_newlines=True, input=text, check=True)
-        elif system == 'Linux':
-            if shutil.which("xclip"):
-                subprocess.run(["xclip", "-selection", "clipboard"], universal_newlines=True, input=text, check=True)
-            elif shutil.which("xsel"):
-                subprocess.run(["xsel", "--clipboard", "--input"], universal_newlines=True, input=text, check=True)
-            else:
-                return False, P['err_xclip']
-        else:
-            return False, P['err_os_unsupported']
+        subprocess.run(_CLIPBOARD_CMD, universal_newlines=True, input=text, check=True)
         return True, "OK (subprocess)"
     except Exception as e:
         return False, str(e)
@@ -634,9 +889,9 @@ def main():
 
     if config.get('preset'):
         p = PRESETS[config['preset']]
-        if not args.len: config['len'] = p['len']
-        config['upper'], config['lower'], config['digits'], config['symbols'] = p['u'], p['l'], p['d'], p['s']
-        if not args.safe: config['safe'] = p['safe']
+        if not args.len: config['len'] = p.len
+        config['upper'], config['lower'], config['digits'], config['symbols'] = p.u, p.l, p.d, p.s
+        if not args.safe: config['safe'] = p.safe
 
     if not config['preset'] and not config['words'] and not config['mask'] and not config['custom']:
         if not any([config['upper'], config['lower'], config['digits'], config['symbols']]):
@@ -644,43 +899,50 @@ def main():
 
     passwords =[]
     try:
-        for _ in range(config['count']):
-            if config['words'] and config['words'] > 0:
-                raw, bits = generate_passphrase(config['words'], config['sep'], config['wordlist'])
-            elif config['mask']:
-                raw, bits = generate_mask(config['mask'], config['safe'], config['exclude'], config['no_ambiguous'])
-            else:
-                raw, bits = generate_password_standard(
-                    config['len'], config['upper'], config['lower'], config['digits'], config['symbols'],
-                    config['safe'], config['custom'], config['exclude'], config['no_ambiguous']
-                )
+        spec = None
+        if not (config['words'] and config['words'] > 0) and not config['mask']:
+            spec = build_pool_spec(
+                config['upper'], config['lower'], config['digits'], config['symbols'],
+                config['safe'], config['custom'], config['exclude'], config['no_ambiguous']
+            )
+        if spec is not None and config['count'] >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            for raw, bits in generate_parallel_from_spec(spec, config['len'], config['count']):
+                passwords.append((format_output(raw, config['group'], config['sep']), bits))
+        elif spec is not None and HAS_NUMPY and config['count'] >= BATCH_THRESHOLD and spec[1].isascii():
+            for raw, bits in generate_batch_from_spec(spec, config['len'], config['count']):
+                passwords.append((format_output(raw, config['group'], config['sep']), bits))
+        else:
+            for _ in range(config['count']):
+                if config['words'] and config['words'] > 0:
+                    raw, bits = generate_passphrase(config['words'], config['sep'], config['wordlist'])
+                elif config['mask']:
+                    raw, bits = generate_mask(config['mask'], config['safe'], config['exclude'], config['no_ambiguous'])
+                else:
+                    raw, bits = generate_from_spec(spec, config['len'])
 
-            if not config['words'] and not config['mask']:
-                fmt = format_output(raw, config['group'], config['sep'])
-            else:
-                fmt = raw
-            passwords.append((fmt, bits))
+                if not config['words'] and not config['mask']:
+                    fmt = format_output(raw, config['group'], config['sep'])
+                else:
+                    fmt = raw
+                passwords.append((fmt, bits))
 
         out_buf =[]
-        if not config['quiet']: print("-" * 50)
+        lines =[]
+        if not config['quiet']: lines.append("-" * 50)
 
         for i, (pwd, bits) in enumerate(passwords):
             out_buf.append(pwd)
             if config['quiet']:
-                print(pwd)
+                lines.append(pwd)
             else:
-                if bits >= 80:
-                    q = f"{COLOR_GREEN}🔒 STRONG{COLOR_RESET}"
-                elif bits >= 60:
-                    q = f"{COLOR_YELLOW}✅ OK{COLOR_RESET}"
-                else:
-                    q = f"{COLOR_RED}⚠️ WEAK{COLOR_RESET}"
+                q = ENTROPY_TIERS[(bits >= 60) + (bits >= 80)]
                 pfx = f"[{i+1}] " if config['count'] > 1 else ""
-                print(f"{pfx}{pwd}\n    └── {P['entropy_lbl']}: {int(bits)} {P['bits_lbl']} | {q}")
+                lines.append(f"{pfx}{pwd}\n    └── {P['entropy_lbl']}: {int(bits)} {P['bits_lbl']} | {q}")
                 if config['phonetic']:
-                    print(f"    └── {P['phonetic_lbl']}: {get_phonetic_string(pwd)}")
+                    lines.append(f"    └── {P['phonetic_lbl']}: {get_phonetic_string(pwd)}")
 
-        if not config['quiet']: print("-" * 50)
+        if not config['quiet']: lines.append("-" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         if config['output']:
             try: